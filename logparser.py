@@ -50,6 +50,10 @@ Arguments:
   --chrono       Optional: Sort all matching lines chronologically across all log files
   --matchonly    Optional: Output only the matched log lines without formatting
   --keywordfiles Optional: Output matches for each keyword to separate CSV files
+  --assume-sorted Optional: Trust each log file to be in timestamp order already, so
+                 --chrono and --keywordfiles stream a merge of the files instead of
+                 sorting each file's matches first. The merge keeps every file open,
+                 so above 128 files the files are sorted as without this option
 
 Keywords File Format:
 -------------------
@@ -71,14 +75,33 @@ Error Handling:
 Dependencies:
 ------------
 - Python 3.x
-- Standard library modules: argparse, os, collections.defaultdict, glob, datetime
+- Standard library modules: argparse, contextlib, os, sys, re, collections.defaultdict, collections.deque, concurrent.futures, glob, datetime, functools, heapq, operator, typing
+- Optional: hyperscan or pyahocorasick, used for faster multi-keyword matching when installed
 """
 
 import argparse
+import contextlib
 import os
+import sys
+import re
 import glob
 import datetime
-from collections import defaultdict
+import functools
+import heapq
+from operator import itemgetter
+from typing import NamedTuple
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 def parse_arguments():
     parser = argparse.ArgumentParser(description="Parse log files for keywords")
@@ -87,6 +110,7 @@ def parse_arguments():
     parser.add_argument("--chrono", action="store_true", help="Sort matches chronologically")
     parser.add_argument("--matchonly", action="store_true", help="Output only matched log lines")
     parser.add_argument("--keywordfiles", action="store_true", help="Output matches for each keyword to separate CSV files")
+    parser.add_argument("--assume-sorted", action="store_true", help="Treat each log file as already in timestamp order and stream the merge")
     return parser.parse_args()
 
 def expand_log_paths(log_patterns):
@@ -102,6 +126,12 @@ def expand_log_paths(log_patterns):
     return log_files
 
 def read_keywords(keywords_file):
+    """
+    Read the keywords file.
+    Returns the keyword to description map together with the KeywordMatcher
+    built from it. The matcher is built once here and passed to every scan,
+    including worker processes, so its compile cost is paid once per run.
+    """
     keyword_comment_map = defaultdict(str)
     with open(keywords_file, 'r') as f:
         for line in f:
@@ -112,7 +142,380 @@ def read_keywords(keywords_file):
                 print(f"Keyword: {keyword}, Comment: {comment}")
             else:
                 print(f"Invalid line in keywords file: {line.strip()}")
-    return keyword_comment_map
+    return keyword_comment_map, KeywordMatcher(keyword_comment_map)
+
+# Hyperscan match callbacks; the scan context carries their result container
+def collect_hit_id(index, start, end, flags, hits):
+    hits.add(index)
+
+def stop_at_first_hit(index, start, end, flags, hit_ends):
+    hit_ends.append(end)
+    return True  # stop the scan, only the earliest hit is needed
+
+# Keyword sets up to this size get a generated match function, and are found
+# with per-group regex searches, which beat the automaton at this size
+SMALL_KEYWORD_SET = 8
+
+class KeywordMatcher:
+    """
+    Finds all keywords contained in a raw (bytes) log line with a single pass
+    over the line.
+    Uses a Hyperscan database when hyperscan is available, then an Aho-Corasick
+    automaton when pyahocorasick is available and the keyword set is large,
+    otherwise falls back to one alternation regex per group of keywords
+    sharing a first byte.
+    """
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self.patterns = [keyword.encode() for keyword in self.keywords]
+        # Any hit must start with one of these bytes; a cheap character class
+        # search rules out hit-free stretches before the real matcher runs
+        first_bytes = sorted({pattern[:1] for pattern in self.patterns if pattern})
+        self.prefilter = re.compile(b'[' + b''.join(map(re.escape, first_bytes)) + b']') if first_bytes else None
+        # An empty keyword is found in every line; the backends skip it
+        self.empty_ids = [index for index, pattern in enumerate(self.patterns) if not pattern]
+        self.database = None
+        self.scratch = None
+        self.automaton = None
+        self.buckets = []
+        if hyperscan is not None and any(self.patterns):
+            ids = [index for index, pattern in enumerate(self.patterns) if pattern]
+            self.database = hyperscan.Database()
+            self.database.compile(expressions=[self.patterns[index] for index in ids], ids=ids,
+                                  elements=len(ids), flags=hyperscan.HS_FLAG_SINGLEMATCH, literal=True)
+            self.scratch = hyperscan.Scratch(self.database)
+        elif ahocorasick is not None and any(self.patterns) and len(self.keywords) > SMALL_KEYWORD_SET:
+            # The automaton only accepts str; latin-1 maps each byte to one
+            # character so lines can be matched without a real decode
+            self.automaton = ahocorasick.Automaton()
+            for index in range(len(self.keywords)):
+                self.automaton.add_word(self.patterns[index].decode('latin-1'), index)
+            self.automaton.make_automaton()
+        else:
+            self.buckets = self.build_buckets(self.patterns)
+        if len(self.patterns) <= SMALL_KEYWORD_SET:
+            self.match = self.build_specialized_match(self.patterns)
+
+    @staticmethod
+    def build_buckets(patterns):
+        """
+        Group keywords by first byte and compile one regex per group.
+        Several small literal regexes scan faster than one combined pattern.
+        A group whose keywords all start with one of them is found by a plain
+        bytes.find of that shortest keyword instead of the regex.
+        Returns list of (compiled regex, [(index, pattern), ...],
+        shortest keyword pattern or None) tuples.
+        """
+        grouped = defaultdict(list)
+        for index, pattern in enumerate(patterns):
+            if pattern:
+                grouped[pattern[:1]].append((index, pattern))
+        buckets = []
+        for entries in grouped.values():
+            by_length = sorted((pattern for _, pattern in entries), key=len, reverse=True)
+            regex = re.compile(b'|'.join(map(re.escape, by_length)))
+            shortest = by_length[-1]
+            literal = shortest if os.path.commonprefix(by_length) == shortest else None
+            buckets.append((regex, entries, literal))
+        return buckets
+
+    @staticmethod
+    def build_specialized_match(patterns):
+        """
+        Generate a match function for a small keyword set, with one substring
+        test per keyword written out as straight-line code.
+        """
+        source = ['def match(line):', '    hits = []']
+        for index, pattern in enumerate(patterns):
+            source.append(f'    if {pattern!r} in line: hits.append({index})')
+        source.append('    return hits')
+        namespace = {}
+        exec('\n'.join(source), namespace)
+        return namespace['match']
+
+    def __getstate__(self):
+        # Hyperscan databases do not pickle; ship the serialized form to
+        # worker processes and give each its own scratch space. Generated
+        # match functions do not pickle either and are rebuilt on arrival
+        state = self.__dict__.copy()
+        state.pop('match', None)
+        if self.database is not None:
+            state['database'] = hyperscan.dumpb(self.database)
+            state['scratch'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.database is not None:
+            self.database = hyperscan.loadb(self.database, hyperscan.HS_MODE_BLOCK)
+            self.scratch = hyperscan.Scratch(self.database)
+        if len(self.patterns) <= SMALL_KEYWORD_SET:
+            self.match = self.build_specialized_match(self.patterns)
+
+    def match(self, line):
+        """
+        Return the ids (indexes into self.keywords) of the keywords found in
+        line (bytes), in keywords file order.
+        """
+        hits = set(self.empty_ids)
+        if self.database is not None:
+            self.database.scan(line, match_event_handler=collect_hit_id, context=hits,
+                               scratch=self.scratch)
+        elif self.automaton is not None:
+            hits.update(index for _, index in self.automaton.iter(line.decode('latin-1')))
+        else:
+            for regex, entries, _ in self.buckets:
+                if regex.search(line):
+                    # Confirm each keyword of the group, the regex reports only
+                    # one of several overlapping keywords
+                    hits.update(index for index, pattern in entries if pattern in line)
+        return sorted(hits)
+
+    def iter_hit_lines(self, buf, size=None):
+        """
+        Scan the first size bytes of a buffer (all of it by default), which
+        must end on a line boundary, without splitting or copying it.
+        Yields (start, end) offsets of each line containing a keyword, newline excluded.
+        """
+        if size is None:
+            size = len(buf)
+        # Bound methods are hoisted out of the loops; these run once per hit
+        rfind = buf.rfind
+        find = buf.find
+        if self.empty_ids:
+            start = 0
+            while start < size:
+                end = find(b'\n', start, size)
+                if end < 0:
+                    end = size
+                yield start, end
+                start = end + 1
+            return
+        if self.prefilter is None or self.prefilter.search(buf, 0, size) is None:
+            return
+
+        prefilter = self.prefilter.search
+        pos = 0
+        if self.database is not None:
+            view = memoryview(buf)
+            scan = self.database.scan
+            scratch = self.scratch
+            hit_ends = []
+            while pos < size:
+                candidate = prefilter(buf, pos, size)
+                if candidate is None:
+                    return
+                pos = candidate.start()
+                hit_ends.clear()
+                try:
+                    scan(view[pos:size], match_event_handler=stop_at_first_hit, context=hit_ends, scratch=scratch)
+                except hyperscan.ScanTerminated:
+                    pass
+                if not hit_ends:
+                    return
+                hit = pos + hit_ends[0] - 1
+                start = rfind(b'\n', 0, hit) + 1
+                end = find(b'\n', hit, size)
+                if end < 0:
+                    end = size
+                yield start, end
+                pos = end + 1
+            return
+
+        if self.automaton is not None:
+            # One pass of one iterator per chunk: starting a new automaton
+            # iterator costs time proportional to the text it is given
+            for hit, _ in self.automaton.iter(buf.decode('latin-1'), 0, size):
+                if hit < pos:
+                    continue  # further keywords on a line already yielded
+                start = rfind(b'\n', 0, hit) + 1
+                end = find(b'\n', hit, size)
+                if end < 0:
+                    end = size
+                yield start, end
+                pos = end + 1
+            return
+
+        # Next hit of every group; re-searched only once the scan passes it
+        next_hits = [-1] * len(self.buckets)
+        while pos < size:
+            for i, (regex, _, literal) in enumerate(self.buckets):
+                if next_hits[i] < pos:
+                    if literal is not None:
+                        hit = find(literal, pos, size)
+                    else:
+                        found = regex.search(buf, pos, size)
+                        hit = found.start() if found is not None else -1
+                    next_hits[i] = hit if hit >= 0 else size
+            first = min(next_hits, default=size)
+            if first >= size:
+                return
+            start = rfind(b'\n', 0, first) + 1
+            end = find(b'\n', first, size)
+            if end < 0:
+                end = size
+            yield start, end
+            pos = end + 1
+
+READ_SIZE = 1 << 20
+# Number of chunk reads kept in flight ahead of the scan
+READ_AHEAD = 4
+# Chunk size for scans kept open side by side by the streaming merge, which
+# read on demand without read-ahead
+MERGE_READ_SIZE = 1 << 16
+# The streaming merge holds one open descriptor per file; beyond this many
+# files it falls back to sorting each file's matches, which opens one at a time
+MERGE_MAX_OPEN_FILES = 128
+
+def iter_chunks(fd, read_ahead=True):
+    """
+    Yield successive READ_SIZE chunks of an open file.
+    Where os.pread is available, the next READ_AHEAD chunks are read on
+    background threads while the caller scans the current one, so disk reads
+    overlap with keyword matching.
+    If read_ahead is False, MERGE_READ_SIZE chunks are read only when asked for.
+    """
+    if not read_ahead or not hasattr(os, 'pread'):
+        read_size = READ_SIZE if read_ahead else MERGE_READ_SIZE
+        while True:
+            data = os.read(fd, read_size)
+            if not data:
+                return
+            yield data
+
+    with ThreadPoolExecutor(max_workers=READ_AHEAD) as reader:
+        pending = deque()
+        offset = 0
+        for _ in range(READ_AHEAD):
+            pending.append(reader.submit(os.pread, fd, READ_SIZE, offset))
+            offset += READ_SIZE
+        while pending:
+            data = pending.popleft().result()
+            if data:
+                yield data
+            if len(data) < READ_SIZE:
+                # End of file; later offsets may still see data appended since
+                for future in pending:
+                    future.cancel()
+                return
+            pending.append(reader.submit(os.pread, fd, READ_SIZE, offset))
+            offset += READ_SIZE
+
+def iter_matching_lines(log_file, matcher, read_ahead=True):
+    """
+    Read a log file in large binary chunks and scan each chunk as a whole.
+    Lines are only cut out and decoded when they contain a keyword.
+    read_ahead is passed on to iter_chunks.
+    Yields (line, keyword ids) tuples for each matching line.
+    """
+    # O_BINARY keeps Windows from opening in text mode, which stops at \x1a
+    fd = os.open(log_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    if hasattr(os, 'posix_fadvise'):
+        # Widen kernel readahead for the sequential scan; the hint is best effort
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    chunks = iter_chunks(fd, read_ahead)
+    iter_hit_lines = matcher.iter_hit_lines
+    match = matcher.match
+    try:
+        # Reads holding a trailing partial line, joined once a newline arrives
+        carry = []
+        for data in chunks:
+            # Only the new bytes are searched; the carried ones hold no newline
+            cut = data.rfind(b'\n') + 1
+            if cut == 0:
+                carry.append(data)
+                continue
+            if carry:
+                carry.append(data)
+                chunk = b''.join(carry)
+                cut += len(chunk) - len(data)
+            else:
+                chunk = data
+            # Scan the whole lines in place; the only slices taken are the
+            # short carried tail and the hit lines themselves, newline excluded
+            for start, end in iter_hit_lines(chunk, cut):
+                line = chunk[start:end]
+                yield line.decode(errors='replace').strip(), match(line)
+            carry = [chunk[cut:]] if cut < len(chunk) else []
+        if carry:
+            carry = b''.join(carry)
+            for start, end in iter_hit_lines(carry):
+                line = carry[start:end]
+                yield line.decode(errors='replace').strip(), match(line)
+    finally:
+        # Let in-flight reads finish before their descriptor goes away
+        chunks.close()
+        os.close(fd)
+
+MONTH_ABBR = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+# CSV style dd/MM/yyyy HH:mm:ss tt format, found in the 4th column
+CSV_TIMESTAMP_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})\s+(\d{1,2}):(\d{1,2}):(\d{1,2})\s+([AaPp][Mm])')
+
+# Standard log formats, matched at the start of the line. Fields accept one
+# or two digits where strptime's %d, %m, %H, %M and %S do, and any whitespace
+# run where the format has a space
+CLOCK = r'(?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})'
+TIMESTAMP_FORMATS = {
+    'iso': r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})\s+' + CLOCK + r',(?P<fraction>\d+)',     # 2025-01-15 23:39:16,366
+    'iso_t': r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})T' + CLOCK + r'\.(?P<fraction>\d+)Z',  # 2025-01-15T23:39:16.366Z
+    'apache': r'(?P<day>\d{1,2})/(?P<month_name>[A-Za-z]{3})/(?P<year>\d{4}):' + CLOCK + r'\s+(?P<offset>[+-]\d{4})',  # 15/Jan/2025:23:39:16 +0000
+    'unix': r'[A-Za-z]{3}\s+(?P<month_name>[A-Za-z]{3})\s+(?P<day>\d{1,2})\s+' + CLOCK + r'\s+(?P<year>\d{4})',  # Wed Jan 15 23:39:16 2025
+    'slash': r'(?P<year>\d{4})/(?P<month>\d{1,2})/(?P<day>\d{1,2})\s+' + CLOCK,                         # 2025/01/15 23:39:16
+    'dash': r'(?P<day>\d{1,2})-(?P<month_name>[A-Za-z]{3})-(?P<year>\d{4})\s+' + CLOCK,                  # 15-Jan-2025 23:39:16
+    'syslog': r'(?P<month_name>[A-Za-z]{3})\s+(?P<day>\d{1,2})\s+' + CLOCK + r'(?:\s+(?P<year>\d{4}))?',  # Jan 15 23:39:16 [2025]
+}
+TIMESTAMP_FIELDS_RE = {kind: re.compile(pattern) for kind, pattern in TIMESTAMP_FORMATS.items()}
+# One alternation names the matching format; its fields are only read back,
+# through TIMESTAMP_FIELDS_RE, when the timestamp text is not cached yet
+TIMESTAMP_RE = re.compile('|'.join(f'(?P<{kind}>{re.sub(r"[(][?]P<[a-z_]+>", "(?:", pattern)})'
+                                   for kind, pattern in TIMESTAMP_FORMATS.items()))
+
+# Distinct timestamp strings remembered; log lines often repeat the same
+# stamp, so most matched lines skip building the datetime entirely
+TIMESTAMP_CACHE_SIZE = 100_000
+
+@functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def build_csv_timestamp(text):
+    """
+    Build a datetime from a CSV dd/MM/yyyy hh:mm:ss tt column.
+    Returns None if the column is not in that format.
+    """
+    m = CSV_TIMESTAMP_RE.fullmatch(text)
+    if m is None:
+        return None
+    day, month, year, hour, minute, second, meridiem = m.groups()
+    hour = int(hour) % 12 + (12 if meridiem.upper() == 'PM' else 0)
+    return datetime.datetime(int(year), int(month), int(day), hour, int(minute), int(second))
+
+@functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def build_timestamp(kind, text):
+    """
+    Build a datetime from the text matched by the TIMESTAMP_RE group named kind.
+    Offsets are normalised so every result is a naive UTC-comparable datetime.
+    """
+    fields = TIMESTAMP_FIELDS_RE[kind].fullmatch(text).groupdict()
+    if 'month' in fields:
+        month = int(fields['month'])
+    else:
+        month = MONTH_ABBR[fields['month_name'].title()]
+    # Short syslog format without a year keeps strptime's default of 1900
+    year = int(fields['year']) if fields['year'] else 1900
+    fraction = fields.get('fraction')
+    microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+    timestamp = datetime.datetime(year, month, int(fields['day']), int(fields['hour']),
+                                  int(fields['minute']), int(fields['second']), microsecond)
+    offset = fields.get('offset')
+    if offset:
+        delta = datetime.timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+        timestamp -= -delta if offset[0] == '-' else delta
+    return timestamp
 
 def parse_timestamp(line):
     """
@@ -120,158 +523,210 @@ def parse_timestamp(line):
     Returns datetime object if successful, None if no timestamp found.
     """
     try:
-        # CSV style dd/MM/yyyy HH:mm:ss tt format
         if ',' in line:
             parts = line.split(',')
             if len(parts) >= 4:  # Connected field is the 4th column
-                timestamp_str = parts[3].strip()
-                return datetime.datetime.strptime(timestamp_str, "%d/%m/%Y %I:%M:%S %p")
-        
-        # Standard log formats
-        formats = [
-            "%Y-%m-%d %H:%M:%S,%f",          # 2025-01-15 23:39:16,366
-            "%Y-%m-%dT%H:%M:%S.%fZ",         # 2025-01-15T23:39:16.366Z
-            "%b %d %H:%M:%S %Y",             # Jan 15 23:39:16 2025
-            "%d/%b/%Y:%H:%M:%S %z",          # 15/Jan/2025:23:39:16 +0000
-            "%a %b %d %H:%M:%S %Y",          # Wed Jan 15 23:39:16 2025
-            "%Y/%m/%d %H:%M:%S",             # 2025/01/15 23:39:16
-            "%d-%b-%Y %H:%M:%S",             # 15-Jan-2025 23:39:16
-            "%b %d %H:%M:%S",                # Jan 15 23:39:16
-        ]
-        
-        # Try each format
-        first_part = ' '.join(line.split()[:6])
-        for fmt in formats:
-            try:
-                return datetime.datetime.strptime(first_part, fmt)
-            except ValueError:
-                continue
-                
-        return None
-    except (ValueError, IndexError):
+                timestamp = build_csv_timestamp(parts[3].strip())
+                if timestamp is not None:
+                    return timestamp
+
+        m = TIMESTAMP_RE.match(line)
+        if m is None:
+            return None
+        return build_timestamp(m.lastgroup, m.group())
+    except (ValueError, KeyError, OverflowError):
         return None
 
-def collect_matches(log_files, keyword_comment_map):
+class Match(NamedTuple):
+    """
+    A keyword hit. Keyword and file are stored as ids into the matcher's
+    keyword list and the scanned log file list, so millions of matches do not
+    each hold their own copies of the path and description strings.
+    Timestamps are epoch seconds; lines without one sort first.
+    """
+    timestamp: float
+    keyword_id: int
+    line: str
+    file_id: int
+
+EPOCH = datetime.datetime(1970, 1, 1)
+NO_TIMESTAMP = float('-inf')
+# Plain float sort key read by index in C; lets list.sort use its float fast path
+TIMESTAMP_KEY = itemgetter(0)
+
+def scan_log_file(file_id, log_file, matcher, read_ahead=True):
+    """
+    Scan a single log file for matches with their timestamps.
+    Yields Match tuples in file order.
+    """
+    for line, keyword_ids in iter_matching_lines(log_file, matcher, read_ahead):
+        timestamp = parse_timestamp(line)
+        timestamp = NO_TIMESTAMP if timestamp is None else (timestamp - EPOCH).total_seconds()
+        for keyword_id in keyword_ids:
+            yield Match(timestamp, keyword_id, line, file_id)
+
+def sorted_file_matches(file_id, log_file, matcher):
+    """
+    Return the matches of a single log file sorted by timestamp.
+    Log files are normally already in order, so the stable sort is close to linear.
+    """
+    return sorted(scan_log_file(file_id, log_file, matcher), key=TIMESTAMP_KEY)
+
+# Matcher handed once to each worker process by init_scan_worker
+scan_worker_context = {}
+
+def init_scan_worker(matcher):
+    scan_worker_context['matcher'] = matcher
+
+def scan_worker(file_id, log_file):
+    return sorted_file_matches(file_id, log_file, scan_worker_context['matcher'])
+
+def collect_matches(log_files, matcher, assume_sorted=False):
     """
     Collect all matches from all files with their timestamps and source files.
-    Returns: list of (timestamp, comment, line, source_file) tuples
+    Files are scanned in parallel worker processes when there is more than one,
+    each file's matches are sorted, then the per-file results are k-way merged
+    by timestamp.
+    If assume_sorted is True, every file is trusted to already be in timestamp
+    order: the files are scanned lazily in this process and merged as they are
+    read, so each file holds only an open descriptor, one MERGE_READ_SIZE
+    chunk and the partial line carried over from it. With more than
+    MERGE_MAX_OPEN_FILES files the sorted path is used instead to stay within
+    the open file limit.
+    Returns: iterator of Match tuples in chronological order, whose file_id
+    indexes log_files
     """
-    matches = []
-    min_datetime = datetime.datetime.min
-    
-    for log_file in log_files:
+    readable = []
+    for file_id, log_file in enumerate(log_files):
         if not os.path.isfile(log_file) or not os.access(log_file, os.R_OK):
             print(f"Error: Log file '{log_file}' not found or not readable.")
             continue
+        readable.append((file_id, log_file))
 
-        with open(log_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                for keyword in keyword_comment_map:
-                    if keyword in line:
-                        timestamp = parse_timestamp(line)
-                        if timestamp is None:
-                            timestamp = min_datetime
-                        matches.append({
-                            'timestamp': timestamp,
-                            'comment': keyword_comment_map[keyword],
-                            'line': line,
-                            'file': log_file
-                        })
-    
-    # Sort all matches by timestamp
-    matches.sort(key=lambda x: x['timestamp'])
-    return matches
+    if assume_sorted and len(readable) <= MERGE_MAX_OPEN_FILES:
+        streams = [scan_log_file(file_id, log_file, matcher, read_ahead=False) for file_id, log_file in readable]
+        return heapq.merge(*streams, key=TIMESTAMP_KEY)
+
+    if len(readable) > 1:
+        workers = min(len(readable), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_scan_worker,
+                                 initargs=(matcher,)) as executor:
+            per_file = list(executor.map(scan_worker, *zip(*readable), chunksize=1))
+    else:
+        per_file = [sorted_file_matches(file_id, log_file, matcher) for file_id, log_file in readable]
 
-def search_log_files(log_files, keyword_comment_map, chronological=False, matchonly=False, keywordfiles=False):
+    # Stable merge: equal timestamps keep file order, as a global sort would
+    return heapq.merge(*per_file, key=TIMESTAMP_KEY)
+
+SEPARATOR = "-" * 80
+
+def open_output():
+    """
+    Open a buffered text writer on stdout, line buffered on a terminal.
+    Falls back to sys.stdout itself when it has no file descriptor.
+    """
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return contextlib.nullcontext(sys.stdout)
+    buffering = 1 if sys.stdout.isatty() else 1 << 20
+    return open(fd, 'w', buffering=buffering, encoding=sys.stdout.encoding,
+                errors=sys.stdout.errors, closefd=False)
+
+def search_log_files(log_files, keyword_comment_map, matcher, chronological=False, matchonly=False, keywordfiles=False,
+                     assume_sorted=False):
     """
     Search log files for keywords and output matches.
-    If chronological is True, sort all matches by timestamp before output.
+    Every mode consumes a single pass over each file: the chunk scan finds the
+    matching lines, timestamps are parsed only for those lines, and matches
+    are written as they come off the scan or the timestamp merge.
+    If chronological is True, merge the per-file matches by timestamp while
+    writing them out.
     If matchonly is True, only output the matched log lines.
     If keywordfiles is True, output matches for each keyword to separate CSV files.
+    If assume_sorted is True, log files are trusted to be in timestamp order
+    and merged without sorting, see collect_matches.
     """
     if keywordfiles:
-        matches = collect_matches(log_files, keyword_comment_map)
-        write_keyword_files(matches, keyword_comment_map)
+        matches = collect_matches(log_files, matcher, assume_sorted)
+        write_keyword_files(matches, matcher)
         return
 
+    comments = [keyword_comment_map[keyword] for keyword in matcher.keywords]
+
     if matchonly:
         if chronological:
-            matches = collect_matches(log_files, keyword_comment_map)
-            for match in matches:
-                print(match['line'])
+            matches = collect_matches(log_files, matcher, assume_sorted)
+            with open_output() as out:
+                for match in matches:
+                    out.write(match.line + '\n')
         else:
-            for log_file in log_files:
-                if not os.path.isfile(log_file) or not os.access(log_file, os.R_OK):
-                    continue
-                with open(log_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        for keyword in keyword_comment_map:
-                            if keyword in line:
-                                print(line)
+            with open_output() as out:
+                for log_file in log_files:
+                    if not os.path.isfile(log_file) or not os.access(log_file, os.R_OK):
+                        continue
+                    for line, keyword_ids in iter_matching_lines(log_file, matcher):
+                        out.write((line + '\n') * len(keyword_ids))
     elif chronological:
-        # Collect and sort all matches from all files
-        matches = collect_matches(log_files, keyword_comment_map)
-        
-        if matches:
-            print("\nMatches in chronological order:")
-            current_file = None
-            
-            for match in matches:
+        # Merge the matches from all files in timestamp order
+        matches = collect_matches(log_files, matcher, assume_sorted)
+        current_file = None
+
+        with open_output() as out:
+            for index, match in enumerate(matches):
+                if index == 0:
+                    out.write("\nMatches in chronological order:\n")
+
                 # Print file header if it's from a new file
-                if match['file'] != current_file:
-                    print(f"\nFrom file: {match['file']}")
-                    current_file = match['file']
-                
-                print(f"\nDescription: {match['comment']}")
-                print(f"Log entry: {match['line']}")
-                print("-" * 80)
+                if match.file_id != current_file:
+                    out.write(f"\nFrom file: {log_files[match.file_id]}\n")
+                    current_file = match.file_id
+
+                out.write(f"\nDescription: {comments[match.keyword_id]}\nLog entry: {match.line}\n{SEPARATOR}\n")
     else:
         # Original file-by-file output
-        print("Occurrences of keywords in log files:")
-        for log_file in log_files:
-            if not os.path.isfile(log_file):
-                print(f"Error: Log file '{log_file}' not found.")
-                continue
-            if not os.access(log_file, os.R_OK):
-                print(f"Error: Log file '{log_file}' is not readable.")
-                continue
+        with open_output() as out:
+            out.write("Occurrences of keywords in log files:\n")
+            for log_file in log_files:
+                if not os.path.isfile(log_file):
+                    out.write(f"Error: Log file '{log_file}' not found.\n")
+                    continue
+                if not os.access(log_file, os.R_OK):
+                    out.write(f"Error: Log file '{log_file}' is not readable.\n")
+                    continue
+
+                file_header_shown = False
+                for line, keyword_ids in iter_matching_lines(log_file, matcher):
+                    if not file_header_shown:
+                        out.write(f"\nFrom file: {log_file}\n")
+                        file_header_shown = True
+                    for keyword_id in keyword_ids:
+                        out.write(f"\nDescription: {comments[keyword_id]}\nLog entry: {line}\n{SEPARATOR}\n")
 
-            file_header_shown = False
-            with open(log_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    for keyword in keyword_comment_map:
-                        if keyword in line:
-                            if not file_header_shown:
-                                print(f"\nFrom file: {log_file}")
-                                file_header_shown = True
-                            print(f"\nDescription: {keyword_comment_map[keyword]}")
-                            print(f"Log entry: {line}")
-                            print("-" * 80)
-
-def write_keyword_files(matches, keyword_comment_map):
+def write_keyword_files(matches, matcher):
     """
     Write matches to separate files for each keyword.
+    Lines are grouped per keyword, then each keyword's file is written in turn.
     """
-    # Create a dictionary to store matches for each keyword
-    keyword_matches = {keyword: [] for keyword in keyword_comment_map.keys()}
-    
-    # Collect matches for each keyword
+    keyword_lines = defaultdict(list)
+    line = encoded = None
     for match in matches:
-        for keyword in keyword_comment_map.keys():
-            if keyword in match['line']:
-                keyword_matches[keyword].append(match['line'])
-    
-    # Write each keyword's matches to a separate file
-    for keyword, lines in keyword_matches.items():
+        # Matches of one line share its str, so the identity check reuses the encoding
+        if match.line is not line:
+            line = match.line
+            encoded = line.encode()
+        keyword_lines[match.keyword_id].append(encoded)
+
+    for keyword_id, keyword in enumerate(matcher.keywords):
+        lines = keyword_lines.get(keyword_id)
         if lines:  # Only create file if there are matches
             filename = f"{keyword}_matches.csv"
             print(f"Writing {len(lines)} matches for keyword '{keyword}' to {filename}")
-            with open(filename, 'w') as f:
-                for line in lines:
-                    f.write(line + '\n')
+            with open(filename, 'wb', buffering=1 << 20) as f:
+                for encoded in lines:
+                    f.write(encoded)
+                    f.write(b'\n')
 
 def main():
     args = parse_arguments()
@@ -280,8 +735,9 @@ def main():
         print("Error: No log files found matching the provided patterns")
         return
     
-    keyword_comment_map = read_keywords(args.keywords)
-    search_log_files(log_files, keyword_comment_map, args.chrono, args.matchonly, args.keywordfiles)
+    keyword_comment_map, matcher = read_keywords(args.keywords)
+    search_log_files(log_files, keyword_comment_map, matcher, args.chrono, args.matchonly, args.keywordfiles,
+                     args.assume_sorted)
 
 if __name__ == "__main__":
     main()